@@ -10,6 +10,7 @@ from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.storage import Store
 import voluptuous as vol
 
@@ -18,11 +19,13 @@ from .const import (
     CONF_RESULTS_PER_SEARCH,
     DEFAULT_RESULTS_PER_SEARCH,
     DOMAIN,
+    NOISE_CACHE_MAX_AGE,
+    SIGNAL_ENTRIES_UPDATED,
     STORAGE_KEY,
     STORAGE_VERSION,
 )
 from .freesound_client import FreesoundClient
-from .noise_generator import NoiseGenerator
+from .noise_generator import NoiseGenerator, is_noise_file_fresh, noise_file_mtime
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -118,6 +121,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "favorites": favorites_data.get("favorites", {}),
         "results_per_search": results_per_search,
     }
+    async_dispatcher_send(hass, SIGNAL_ENTRIES_UPDATED)
     
     # Register services (only once per domain)
     if not hass.services.has_service(DOMAIN, SERVICE_PLAY_FAVORITE):
@@ -285,21 +289,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             )
             
             try:
-                # Create noise generator
-                generator = NoiseGenerator(duration=duration)
-                
-                # Generate the noise
-                wav_data = generator.generate_noise(noise_type, intensity)
-                
-                # Save to temporary file
-                temp_dir = Path(tempfile.gettempdir()) / "ambient_sounds"
-                temp_dir.mkdir(exist_ok=True)
-                
-                temp_file = temp_dir / f"{noise_type}_noise.wav"
-                with open(temp_file, "wb") as f:
-                    f.write(wav_data)
-                
-                _LOGGER.info("Generated noise saved to %s", temp_file)
+                # Reuse a recent file generated with the same settings,
+                # otherwise generate and write it, all in the executor
+                temp_file = (
+                    Path(tempfile.gettempdir())
+                    / "ambient_sounds"
+                    / f"{noise_type}_noise_{duration}s_{round(intensity * 100)}.wav"
+                )
+                if await hass.async_add_executor_job(
+                    _prepare_noise_file, temp_file, noise_type, duration, intensity
+                ):
+                    _LOGGER.info("Generated noise saved to %s", temp_file)
+                else:
+                    _LOGGER.info("Using cached noise file: %s", temp_file)
                 
                 # Play the audio on each media player
                 for entity_id in entity_ids:
@@ -385,6 +387,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     hass.data[DOMAIN].pop(entry.entry_id)
+    async_dispatcher_send(hass, SIGNAL_ENTRIES_UPDATED)
     
     # Only unregister services if this is the last entry
     if len(hass.data[DOMAIN]) == 0:
@@ -402,3 +405,30 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
     await async_unload_entry(hass, entry)
     await async_setup_entry(hass, entry)
+
+
+def _prepare_noise_file(
+    path: Path, noise_type: str, duration: int, intensity: float
+) -> bool:
+    """Generate a play_noise file unless a recent one exists.
+    
+    Stale play_noise files of any type and settings are removed before
+    generating, so the cache directory stays bounded.
+    
+    Returns:
+        True if the file was generated, False if an existing one is reused
+    """
+    path.parent.mkdir(exist_ok=True)
+    if is_noise_file_fresh(noise_file_mtime(path), NOISE_CACHE_MAX_AGE):
+        return False
+    
+    # Only files named by play_noise ({type}_noise_{duration}s_{intensity}.wav)
+    # are evicted; the media source's own files may still be streaming
+    for stale_path in path.parent.glob("*_noise_*s_*.wav"):
+        if stale_path != path and not is_noise_file_fresh(
+            noise_file_mtime(stale_path), NOISE_CACHE_MAX_AGE
+        ):
+            stale_path.unlink(missing_ok=True)
+    
+    NoiseGenerator(duration=duration).save_noise(path, noise_type, intensity)
+    return True
@@ -12,6 +12,12 @@ DEFAULT_RESULTS_PER_SEARCH = 20
 MIN_RESULTS_PER_SEARCH = 1
 MAX_RESULTS_PER_SEARCH = 150
 
+# Generated noise files are reused for this many seconds
+NOISE_CACHE_MAX_AGE = 3600
+
+# Dispatcher signal sent when a config entry is set up or unloaded
+SIGNAL_ENTRIES_UPDATED = f"{DOMAIN}_entries_updated"
+
 # Storage keys
 STORAGE_KEY = f"{DOMAIN}_favorites"
 STORAGE_VERSION = 1
@@ -4,7 +4,6 @@ from __future__ import annotations
 import asyncio
 import logging
 from typing import Any
-from urllib.parse import quote
 
 import aiohttp
 import async_timeout
@@ -15,6 +14,8 @@ _LOGGER = logging.getLogger(__name__)
 
 TIMEOUT = 10
 
+SEARCH_URL = f"{FREESOUND_API_BASE}/search/text/"
+
 
 class FreesoundClient:
     """Client for Freesound API."""
@@ -44,20 +45,18 @@ class FreesoundClient:
         # Freesound allows up to 150 results per page
         per_page = max(1, min(150, per_page))
         
-        # Build search URL with fields we need
+        # Build search parameters with fields we need, aiohttp encodes them
         # Using search endpoint with filters for ambient sounds
-        encoded_query = quote(query)
-        url = (
-            f"{FREESOUND_API_BASE}/search/text/"
-            f"?query={encoded_query}"
-            f"&page_size={per_page}"
-            f"&fields=id,name,tags,duration,previews,username"
-            f"&token={self.api_key}"
-        )
+        params = {
+            "query": query,
+            "page_size": per_page,
+            "fields": "id,name,tags,duration,previews,username",
+            "token": self.api_key,
+        }
         
         try:
             async with async_timeout.timeout(TIMEOUT):
-                async with self.session.get(url) as response:
+                async with self.session.get(SEARCH_URL, params=params) as response:
                     if response.status == 200:
                         data = await response.json()
                         results = data.get("results", [])
@@ -113,9 +112,9 @@ class FreesoundClient:
         """
         try:
             # Test with a simple search
-            url = f"{FREESOUND_API_BASE}/search/text/?query=test&page_size=1&token={self.api_key}"
+            params = {"query": "test", "page_size": 1, "token": self.api_key}
             async with async_timeout.timeout(TIMEOUT):
-                async with self.session.get(url) as response:
+                async with self.session.get(SEARCH_URL, params=params) as response:
                     if response.status == 200:
                         return True
                     else:
@@ -1,12 +1,20 @@
 """Media Source implementation for Ambient Sounds integration."""
 from __future__ import annotations
 
+import asyncio
+import copy
+import functools
 import logging
+import re
 import tempfile
 import time
+from collections import ChainMap, OrderedDict
+from collections.abc import Mapping
 from pathlib import Path
-from urllib.parse import quote, unquote
+from urllib.parse import quote, quote_from_bytes, unquote
 
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.media_player import MediaClass, MediaType
 from homeassistant.components.media_source import (
     BrowseMediaSource,
@@ -15,19 +23,328 @@ from homeassistant.components.media_source import (
     PlayMedia,
     Unresolvable,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN
+from .const import (
+    DEFAULT_RESULTS_PER_SEARCH,
+    DOMAIN,
+    NOISE_CACHE_MAX_AGE,
+    SIGNAL_ENTRIES_UPDATED,
+)
+from .freesound_client import FreesoundClient
 
 _LOGGER = logging.getLogger(__name__)
 
 # Default intensity for generated noise
 DEFAULT_NOISE_INTENSITY = 0.5
 
+# Path generated noise is served from, both the view's route and the
+# template for resolved URLs
+NOISE_URL = "/api/ambient_sounds/noise/{noise_type}/{duration}.wav"
+
+# Number of recent queries whose results are indexed for detail views
+SOUND_INDEX_MAX_QUERIES = 32
+
+# Freesound search results are reused for repeat queries, sort toggles and
+# detail views for this many seconds
+SEARCH_CACHE_TTL = 300
+SEARCH_CACHE_MAX_QUERIES = 32
+
+# Enum members bound once; children are built in loops on every browse
+_MEDIA_CLASS_DIRECTORY = MediaClass.DIRECTORY
+_MEDIA_CLASS_MUSIC = MediaClass.MUSIC
+_MEDIA_TYPE_MUSIC = MediaType.MUSIC
+
+# Noise value is "{noise_type}:{duration in seconds}"
+_NOISE_RE = re.compile(r"^(?P<noise_type>[a-z]+):(?P<duration>[0-9]+)$")
+
+# Preview value is "{sound_id}:{quoted query}:{quoted url}"; quoting removes
+# any colons from the query and URL
+_PREVIEW_RE = re.compile(
+    r"^(?P<sound_id>[^:]+):(?P<query>[^:]*):(?P<url>.+)$", re.DOTALL
+)
+
+# Search queries repeat across browse calls, so memoize their percent-encoding
+_quote = functools.lru_cache(maxsize=2048)(quote)
+_unquote = functools.lru_cache(maxsize=2048)(unquote)
+
+# Quoting is per character, so a sort variant's identifier is the quoted
+# query followed by the quoted sort suffix
+_SORT_BY_NAME_QUOTED = quote("|sort:name")
+_SORT_BY_DURATION_QUOTED = quote("|sort:duration")
+
+# Suggested searches shown at the top of the search directory
+SEARCH_SUGGESTIONS = [
+    "rain", "ocean", "forest", "wind", "thunder",
+    "fire", "birds", "river", "waterfall", "cafe",
+    "city", "nature", "ambient", "meditation", "relaxing"
+]
+
+# Example searches shown for custom search: (query, display title)
+CUSTOM_SEARCH_EXAMPLES = [
+    ("rain thunder", "🌧️ Rain + Thunder"),
+    ("ocean waves", "🌊 Ocean Waves"),
+    ("forest morning", "🌲 Forest Morning"),
+    ("wind howling", "💨 Wind Howling"),
+    ("city traffic", "🚗 City Traffic"),
+    ("cafe ambience", "☕ Cafe Ambience"),
+    ("fireplace crackling", "🔥 Fireplace"),
+    ("birds chirping", "🐦 Birds Chirping"),
+    ("river flowing", "🏞️ River Flowing"),
+    ("thunderstorm", "⛈️ Thunderstorm"),
+]
+
+# Noise generator options: (noise type, display title, description)
+NOISE_TYPES = [
+    ("white", "⚪ White Noise", "Equal energy at all frequencies - great for sleep & focus"),
+    ("pink", "🎀 Pink Noise", "Equal energy per octave - more natural than white noise"),
+    ("brown", "🟤 Brown Noise", "Deeper, bass-heavy sound - very soothing"),
+    ("fan", "🌀 Fan Noise", "Electric fan simulation with motor hum"),
+    ("rain", "🌧️ Rain", "Realistic rainfall with droplet sounds"),
+    ("ocean", "🌊 Ocean Waves", "Rhythmic wave patterns and surf"),
+    ("wind", "💨 Wind", "Gusting wind with natural variation"),
+]
+
+# Common noise durations: (seconds, label)
+NOISE_DURATIONS = [
+    (60, "1 minute"),
+    (300, "5 minutes"),
+    (600, "10 minutes"),
+    (900, "15 minutes"),
+    (1800, "30 minutes"),
+    (3600, "1 hour"),
+    (7200, "2 hours"),
+    (10800, "3 hours"),
+]
+
+# (query, quoted query, display title) for each suggestion, computed once
+_SEARCH_SUGGESTIONS_QUOTED = [
+    (suggestion, quote(suggestion), suggestion.title())
+    for suggestion in SEARCH_SUGGESTIONS
+]
+
+
+@functools.lru_cache(maxsize=512)
+def _format_clock(duration: int | None) -> str:
+    """Format a duration in seconds as "M:SS", or "Unknown" when unknown."""
+    if not duration:
+        return "Unknown"
+    minutes, seconds = divmod(duration, 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+@functools.lru_cache(maxsize=512)
+def _format_duration(duration: int | None) -> str:
+    """Format a duration in seconds as " (M:SS)", or "" when unknown."""
+    if not duration:
+        return ""
+    return f" ({_format_clock(duration)})"
+
+
+def _result_title(result: dict) -> str:
+    """Return a search result title, using name or tags, capped at 50 chars."""
+    title = result.get("name", result.get("tags", "Ambient Sound"))
+    if len(title) > 50:
+        title = title[:47] + "..."
+    return title
+
+
+def _dir_child(identifier: str, title: str) -> BrowseMediaSource:
+    """Return an expandable directory child."""
+    return BrowseMediaSource(
+        domain=DOMAIN,
+        identifier=identifier,
+        media_class=_MEDIA_CLASS_DIRECTORY,
+        media_content_type="",
+        title=title,
+        can_play=False,
+        can_expand=True,
+        thumbnail=None,
+    )
+
+
+def _info_child(identifier: str, title: str) -> BrowseMediaSource:
+    """Return a leaf child that only displays its title."""
+    return BrowseMediaSource(
+        domain=DOMAIN,
+        identifier=identifier,
+        media_class=_MEDIA_CLASS_DIRECTORY,
+        media_content_type="",
+        title=title,
+        can_play=False,
+        can_expand=False,
+        thumbnail=None,
+    )
+
+
+def _music_child(identifier: str, title: str, can_play: bool = True) -> BrowseMediaSource:
+    """Return a music child, playable or else expandable for details."""
+    return BrowseMediaSource(
+        domain=DOMAIN,
+        identifier=identifier,
+        media_class=_MEDIA_CLASS_MUSIC,
+        media_content_type=_MEDIA_TYPE_MUSIC,
+        title=title,
+        can_play=can_play,
+        can_expand=not can_play,
+        thumbnail=None,
+    )
+
+
+def _build_root_browse() -> BrowseMediaSource:
+    """Build the root level tree."""
+    children = [
+        _dir_child("noise_generator:", "🎛️ Noise Generator"),
+        _dir_child("favorites:", "⭐ Favorites"),
+        _dir_child("search:", "🔍 Search Freesound"),
+    ]
+    
+    return BrowseMediaSource(
+        domain=DOMAIN,
+        identifier="",
+        media_class=_MEDIA_CLASS_DIRECTORY,
+        media_content_type="library",
+        title="Ambient Sounds",
+        can_play=False,
+        can_expand=True,
+        children=children,
+    )
+
+
+def _build_search_suggestions_browse() -> BrowseMediaSource:
+    """Build the search directory with suggestions and custom search option."""
+    children = [
+        # Add custom search option
+        _dir_child("search:custom:", "✏️ Custom Text Search"),
+    ]
+    children.extend(
+        _dir_child(f"search:{quoted}", f"🔍 {display}")
+        for _, quoted, display in _SEARCH_SUGGESTIONS_QUOTED
+    )
+    
+    return BrowseMediaSource(
+        domain=DOMAIN,
+        identifier="search:",
+        media_class=_MEDIA_CLASS_DIRECTORY,
+        media_content_type="",
+        title="🔍 Search Freesound - Select a category or custom search",
+        can_play=False,
+        can_expand=True,
+        children=children,
+    )
+
+
+def _build_custom_search_browse() -> BrowseMediaSource:
+    """Build the custom search examples directory."""
+    # Since Media Browser doesn't support text input directly,
+    # show example searches that users can click
+    # For custom searches, users need to use the ambient_sounds.search service
+    children = [
+        _dir_child(f"search:{quote(search_term)}", display_name)
+        for search_term, display_name in CUSTOM_SEARCH_EXAMPLES
+    ]
+    
+    return BrowseMediaSource(
+        domain=DOMAIN,
+        identifier="search:custom:",
+        media_class=_MEDIA_CLASS_DIRECTORY,
+        media_content_type="",
+        title="✏️ Custom Search Examples (Click to search, or use ambient_sounds.search service)",
+        can_play=False,
+        can_expand=True,
+        children=children,
+    )
+
+
+def _build_noise_generator_browse() -> BrowseMediaSource:
+    """Build the noise type selection directory."""
+    children = [
+        _dir_child(f"noise_generator:{noise_type}", title)
+        for noise_type, title, _description in NOISE_TYPES
+    ]
+    
+    return BrowseMediaSource(
+        domain=DOMAIN,
+        identifier="noise_generator:",
+        media_class=_MEDIA_CLASS_DIRECTORY,
+        media_content_type="",
+        title="🎛️ Noise Generator - Select a noise type",
+        can_play=False,
+        can_expand=True,
+        children=children,
+    )
+
+
+def _build_noise_duration_browse(noise_type: str, noise_name: str) -> BrowseMediaSource:
+    """Build the duration selection directory for a noise type."""
+    children = [
+        _music_child(f"noise:{noise_type}:{duration_sec}", f"▶️ Play for {duration_label}")
+        for duration_sec, duration_label in NOISE_DURATIONS
+    ]
+    
+    return BrowseMediaSource(
+        domain=DOMAIN,
+        identifier=f"noise_generator:{noise_type}",
+        media_class=_MEDIA_CLASS_DIRECTORY,
+        media_content_type="",
+        title=f"{noise_name} - Select duration",
+        can_play=False,
+        can_expand=True,
+        children=children,
+    )
+
+
+# Static directories are built once at import and shallow-copied per browse,
+# so Home Assistant rebinding children on the copy leaves these untouched
+_ROOT_BROWSE = _build_root_browse()
+_SEARCH_SUGGESTIONS_BROWSE = _build_search_suggestions_browse()
+_CUSTOM_SEARCH_BROWSE = _build_custom_search_browse()
+_NOISE_GENERATOR_BROWSE = _build_noise_generator_browse()
+_NOISE_TYPE_KEYS = frozenset(noise_type for noise_type, _title, _description in NOISE_TYPES)
+# Only the browse options can be requested, matched on their ASCII digits, so
+# resolve and the view accept the same values and the cached files are bounded
+_NOISE_DURATION_KEYS = frozenset(str(duration) for duration, _label in NOISE_DURATIONS)
+_NOISE_DURATION_BROWSE = {
+    noise_type: _build_noise_duration_browse(noise_type, title)
+    for noise_type, title, _description in NOISE_TYPES
+}
+
 
 async def async_get_media_source(hass: HomeAssistant) -> AmbientSoundsMediaSource:
     """Set up Ambient Sounds media source."""
-    return AmbientSoundsMediaSource(hass)
+    source = AmbientSoundsMediaSource(hass)
+    hass.http.register_view(AmbientSoundsNoiseView(source))
+    return source
+
+
+class AmbientSoundsNoiseView(HomeAssistantView):
+    """Serve generated noise files to media players."""
+
+    url = NOISE_URL
+    name = "api:ambient_sounds:noise"
+
+    def __init__(self, source: AmbientSoundsMediaSource) -> None:
+        """Initialize the noise view."""
+        self._source = source
+
+    async def get(
+        self, request: web.Request, noise_type: str, duration: str
+    ) -> web.StreamResponse:
+        """Stream a generated noise file, generating it first if missing."""
+        if noise_type not in _NOISE_TYPE_KEYS or duration not in _NOISE_DURATION_KEYS:
+            raise web.HTTPNotFound()
+        duration_sec = int(duration)
+        
+        # Playback outlives the cache age, so serve any existing file whatever
+        # its age; regenerating mid-stream would change the audio under the
+        # player's range requests. Resolving a new playback refreshes it
+        file_path = await self._source.async_generate_noise(
+            noise_type, duration_sec, max_age=None
+        )
+        
+        # FileResponse streams in chunks and honours Range requests
+        return web.FileResponse(file_path)
 
 
 class AmbientSoundsMediaSource(MediaSource):
@@ -39,6 +356,48 @@ class AmbientSoundsMediaSource(MediaSource):
         """Initialize the media source."""
         super().__init__(DOMAIN)
         self.hass = hass
+        
+        # Per-entry data lives in this dict for the lifetime of Home Assistant;
+        # async_setup_entry uses setdefault too, so both share one object
+        self._domain_data: dict = hass.data.setdefault(DOMAIN, {})
+        
+        # Dispatch tables keyed by identifier category
+        self._resolvers = {
+            "noise": self._resolve_noise,
+            "fav": self._resolve_favorite,
+            "preview": self._resolve_preview,
+        }
+        self._browsers = {
+            "noise_generator": self._browse_noise_category,
+            "favorites": self._browse_favorites_category,
+            "search": self._browse_search_category,
+            "search_result": self._browse_search_result_category,
+            "info": self._browse_info_category,
+        }
+        
+        # First available (client, results_per_search), found lazily
+        self._client_cache: tuple[FreesoundClient, int] | None = None
+        async_dispatcher_connect(
+            hass, SIGNAL_ENTRIES_UPDATED, self._async_entries_updated
+        )
+        
+        # Generated noise is cached here; created on first generation
+        self._temp_dir = Path(tempfile.gettempdir()) / "ambient_sounds"
+        self._temp_dir_created = False
+        
+        # Modification times of generated noise files, so fresh files are
+        # reused without touching the filesystem
+        self._noise_mtimes: dict[Path, float] = {}
+        
+        # In-flight noise generations by (noise_type, duration), bounded by the
+        # noise types and browse durations
+        self._generation_locks: dict[tuple[str, int], asyncio.Lock] = {}
+        
+        # (query, results_per_search) -> (monotonic time, results)
+        self._search_cache: OrderedDict[tuple[str, int], tuple[float, list]] = OrderedDict()
+        
+        # Search results by query, then by sound ID
+        self._sound_index: OrderedDict[str, dict[str, dict]] = OrderedDict()
 
     async def async_resolve_media(self, item: MediaSourceItem) -> PlayMedia:
         """Resolve media to a playable URL."""
@@ -49,60 +408,65 @@ class AmbientSoundsMediaSource(MediaSource):
         if not item.identifier:
             raise Unresolvable("No identifier provided")
         
-        parts = item.identifier.split(":", 1)
-        if len(parts) != 2:
+        media_type, sep, media_data = item.identifier.partition(":")
+        if not sep:
             raise Unresolvable(f"Invalid identifier: {item.identifier}")
         
-        media_type, media_data = parts
+        resolver = self._resolvers.get(media_type)
+        if resolver is None:
+            raise Unresolvable(f"Unknown media type: {media_type}")
         
-        if media_type == "noise":
-            # Generate noise on-demand
-            # Format: noise:{noise_type}:{duration}
-            noise_parts = media_data.split(":", 1)
-            if len(noise_parts) != 2:
-                raise Unresolvable(f"Invalid noise identifier: {media_data}")
-            
-            noise_type, duration_str = noise_parts
-            try:
-                duration = int(duration_str)
-            except ValueError:
-                raise Unresolvable(f"Invalid duration: {duration_str}")
-            
-            _LOGGER.info("Generating %s noise for %d seconds", noise_type, duration)
-            
-            # Generate the noise
-            file_path = await self._generate_noise(noise_type, duration)
-            
-            # Return local file path
-            return PlayMedia(f"file://{file_path}", "audio/wav")
-        
-        elif media_type == "fav":
-            # Playing a favorite
-            favorite = await self._get_favorite(media_data)
-            if not favorite:
-                raise Unresolvable(f"Favorite not found: {media_data}")
-            
-            _LOGGER.info("Resolving favorite: %s", favorite["name"])
-            return PlayMedia(favorite["url"], "audio/mpeg")
-        
-        elif media_type == "preview":
-            # Preview a search result - format: preview:{sound_id}:{query}:{url}
-            # Using split with maxsplit=2 to handle URLs with colons (e.g., https://)
-            preview_parts = media_data.split(":", 2)
-            if len(preview_parts) != 3:
-                raise Unresolvable(f"Invalid preview identifier: {media_data}")
-            
-            sound_id, query, audio_url = preview_parts
-            audio_url = unquote(audio_url)
-            
-            if not audio_url:
-                raise Unresolvable(f"No audio URL provided for sound: {sound_id}")
-            
-            _LOGGER.info("Resolving preview for sound ID: %s", sound_id)
-            return PlayMedia(audio_url, "audio/mpeg")
+        return await resolver(media_data)
+
+    async def _resolve_noise(self, media_data: str) -> PlayMedia:
+        """Generate noise on-demand - format: noise:{noise_type}:{duration}."""
+        match = _NOISE_RE.match(media_data)
+        if match is None:
+            raise Unresolvable(f"Invalid noise identifier: {media_data}")
         
-        else:
-            raise Unresolvable(f"Unknown media type: {media_type}")
+        noise_type = match["noise_type"]
+        
+        if noise_type not in _NOISE_TYPE_KEYS:
+            raise Unresolvable(f"Unknown noise type: {noise_type}")
+        if match["duration"] not in _NOISE_DURATION_KEYS:
+            raise Unresolvable(f"Invalid duration: {match['duration']}")
+        duration = int(match["duration"])
+        
+        _LOGGER.info("Generating %s noise for %d seconds", noise_type, duration)
+        
+        # Generate up front so the player's request is answered immediately
+        await self.async_generate_noise(noise_type, duration)
+        
+        # Served by AmbientSoundsNoiseView; Home Assistant signs the relative
+        # URL so media players can fetch it, with range requests for seeking
+        return PlayMedia(
+            NOISE_URL.format(noise_type=noise_type, duration=duration), "audio/wav"
+        )
+
+    async def _resolve_favorite(self, media_data: str) -> PlayMedia:
+        """Resolve a favorite - format: fav:{favorite_id}."""
+        # Favorites live in memory, so a missing ID is rejected without awaiting
+        favorite = self._get_favorite(media_data)
+        if not favorite:
+            raise Unresolvable(f"Favorite not found: {media_data}")
+        
+        _LOGGER.info("Resolving favorite: %s", favorite["name"])
+        return PlayMedia(favorite["url"], "audio/mpeg")
+
+    async def _resolve_preview(self, media_data: str) -> PlayMedia:
+        """Preview a search result - format: preview:{sound_id}:{query}:{url}."""
+        match = _PREVIEW_RE.match(media_data)
+        if match is None:
+            raise Unresolvable(f"Invalid preview identifier: {media_data}")
+        
+        sound_id = match["sound_id"]
+        audio_url = unquote(match["url"])
+        
+        if not audio_url:
+            raise Unresolvable(f"No audio URL provided for sound: {sound_id}")
+        
+        _LOGGER.info("Resolving preview for sound ID: %s", sound_id)
+        return PlayMedia(audio_url, "audio/mpeg")
 
     async def async_browse_media(
         self,
@@ -114,139 +478,77 @@ class AmbientSoundsMediaSource(MediaSource):
             return await self._browse_root()
         
         # Parse identifier - all valid identifiers must have a colon
-        if ":" not in item.identifier:
+        category, sep, value = item.identifier.partition(":")
+        if not sep:
             # This shouldn't happen with the new structure, but handle gracefully
             _LOGGER.warning("Invalid identifier format (no colon): %s", item.identifier)
             return await self._browse_root()
         
-        parts = item.identifier.split(":", 1)
-        if len(parts) != 2:
-            _LOGGER.warning("Invalid identifier format: %s", item.identifier)
-            return await self._browse_root()
-        
-        category, value = parts
-        
-        if category == "noise_generator":
-            # Parse noise_generator identifier
-            # Format: noise_generator: (root - show all noise types)
-            # Format: noise_generator:{noise_type} (show duration options)
-            if not value:
-                return await self._browse_noise_generator()
-            else:
-                # Show duration options for this noise type
-                return await self._browse_noise_duration(value)
-        elif category == "favorites":
-            return await self._browse_favorites()
-        elif category == "search":
-            query = unquote(value) if value else ""
-            return await self._browse_search(query)
-        elif category == "search_result":
-            # Parse search_result identifier: search_result:{sound_id}:{query}
-            result_parts = value.split(":", 1)
-            if len(result_parts) == 2:
-                sound_id, query = result_parts
-                query = unquote(query)
-                return await self._browse_search_result(sound_id, query)
-            _LOGGER.warning("Invalid search result identifier: %s", value)
-            return await self._browse_root()
-        elif category == "info":
-            # Info items are not browsable - return to root
-            _LOGGER.debug("Info item clicked: %s", item.identifier)
-            return await self._browse_root()
-        else:
+        browser = self._browsers.get(category)
+        if browser is None:
             _LOGGER.warning("Unknown category: %s", category)
             return await self._browse_root()
+        
+        return await browser(value)
+
+    async def _browse_noise_category(self, value: str) -> BrowseMediaSource:
+        """Browse noise_generator: (all noise types) or noise_generator:{noise_type}."""
+        if not value:
+            return await self._browse_noise_generator()
+        # Show duration options for this noise type
+        return await self._browse_noise_duration(value)
+
+    async def _browse_favorites_category(self, value: str) -> BrowseMediaSource:
+        """Browse favorites:."""
+        return await self._browse_favorites()
+
+    async def _browse_search_category(self, value: str) -> BrowseMediaSource:
+        """Browse search:{query}."""
+        query = _unquote(value) if value else ""
+        return await self._browse_search(query)
+
+    async def _browse_search_result_category(self, value: str) -> BrowseMediaSource:
+        """Browse search_result:{sound_id}:{query}."""
+        sound_id, sep, query = value.partition(":")
+        if sep:
+            return await self._browse_search_result(sound_id, _unquote(query))
+        _LOGGER.warning("Invalid search result identifier: %s", value)
+        return await self._browse_root()
+
+    async def _browse_info_category(self, value: str) -> BrowseMediaSource:
+        """Info items are not browsable - return to root."""
+        _LOGGER.debug("Info item clicked: info:%s", value)
+        return await self._browse_root()
 
     async def _browse_root(self) -> BrowseMediaSource:
         """Browse root level."""
-        children = [
-            BrowseMediaSource(
-                domain=DOMAIN,
-                identifier="noise_generator:",
-                media_class=MediaClass.DIRECTORY,
-                media_content_type="",
-                title="🎛️ Noise Generator",
-                can_play=False,
-                can_expand=True,
-                thumbnail=None,
-            ),
-            BrowseMediaSource(
-                domain=DOMAIN,
-                identifier="favorites:",
-                media_class=MediaClass.DIRECTORY,
-                media_content_type="",
-                title="⭐ Favorites",
-                can_play=False,
-                can_expand=True,
-                thumbnail=None,
-            ),
-            BrowseMediaSource(
-                domain=DOMAIN,
-                identifier="search:",
-                media_class=MediaClass.DIRECTORY,
-                media_content_type="",
-                title="🔍 Search Freesound",
-                can_play=False,
-                can_expand=True,
-                thumbnail=None,
-            ),
-        ]
-        
-        return BrowseMediaSource(
-            domain=DOMAIN,
-            identifier="",
-            media_class=MediaClass.DIRECTORY,
-            media_content_type="library",
-            title="Ambient Sounds",
-            can_play=False,
-            can_expand=True,
-            children=children,
-        )
+        # Shallow copy so callers filtering children don't alter the cache
+        return copy.copy(_ROOT_BROWSE)
 
     async def _browse_favorites(self) -> BrowseMediaSource:
         """Browse favorites."""
-        favorites = await self._get_all_favorites()
+        favorites = self._get_all_favorites()
         
-        children = []
-        for fav_id, favorite in favorites.items():
-            duration_str = ""
-            if favorite.get("duration"):
-                minutes = favorite["duration"] // 60
-                seconds = favorite["duration"] % 60
-                duration_str = f" ({minutes}:{seconds:02d})"
-            
-            children.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=f"fav:{fav_id}",
-                    media_class=MediaClass.MUSIC,
-                    media_content_type=MediaType.MUSIC,
-                    title=f"{favorite['name']}{duration_str}",
-                    can_play=True,
-                    can_expand=False,
-                    thumbnail=None,
-                )
+        children = [
+            _music_child(
+                f"fav:{fav_id}",
+                f"{favorite['name']}{_format_duration(favorite.get('duration'))}",
             )
+            for fav_id, favorite in favorites.items()
+        ]
         
         if not children:
             # Show a placeholder when no favorites
             children.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier="info:no_favorites",
-                    media_class=MediaClass.DIRECTORY,
-                    media_content_type="",
-                    title="No favorites yet. Search Freesound to add some!",
-                    can_play=False,
-                    can_expand=False,
-                    thumbnail=None,
+                _info_child(
+                    "info:no_favorites", "No favorites yet. Search Freesound to add some!"
                 )
             )
         
         return BrowseMediaSource(
             domain=DOMAIN,
             identifier="favorites:",
-            media_class=MediaClass.DIRECTORY,
+            media_class=_MEDIA_CLASS_DIRECTORY,
             media_content_type="",
             title="⭐ Favorites",
             can_play=False,
@@ -258,50 +560,7 @@ class AmbientSoundsMediaSource(MediaSource):
         """Browse search results."""
         if not query:
             # Show search categories/suggestions and custom search option
-            suggestions = [
-                "rain", "ocean", "forest", "wind", "thunder",
-                "fire", "birds", "river", "waterfall", "cafe",
-                "city", "nature", "ambient", "meditation", "relaxing"
-            ]
-            
-            children = [
-                # Add custom search option
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier="search:custom:",
-                    media_class=MediaClass.DIRECTORY,
-                    media_content_type="",
-                    title="✏️ Custom Text Search",
-                    can_play=False,
-                    can_expand=True,
-                    thumbnail=None,
-                ),
-            ]
-            
-            for suggestion in suggestions:
-                children.append(
-                    BrowseMediaSource(
-                        domain=DOMAIN,
-                        identifier=f"search:{quote(suggestion)}",
-                        media_class=MediaClass.DIRECTORY,
-                        media_content_type="",
-                        title=f"🔍 {suggestion.title()}",
-                        can_play=False,
-                        can_expand=True,
-                        thumbnail=None,
-                    )
-                )
-            
-            return BrowseMediaSource(
-                domain=DOMAIN,
-                identifier="search:",
-                media_class=MediaClass.DIRECTORY,
-                media_content_type="",
-                title="🔍 Search Freesound - Select a category or custom search",
-                can_play=False,
-                can_expand=True,
-                children=children,
-            )
+            return copy.copy(_SEARCH_SUGGESTIONS_BROWSE)
         
         # Check if this is a custom search or sort request
         # Format: custom:{search_text} or {query}|sort:{name|duration}
@@ -310,7 +569,7 @@ class AmbientSoundsMediaSource(MediaSource):
         
         if query.startswith("custom:"):
             # Custom text search - show input prompt
-            return await self._browse_custom_search()
+            return copy.copy(_CUSTOM_SEARCH_BROWSE)
         elif "|sort:" in query:
             # Parse sort parameter
             parts = query.split("|sort:", 1)
@@ -326,69 +585,38 @@ class AmbientSoundsMediaSource(MediaSource):
         elif sort_by == "duration":
             results = sorted(results, key=lambda x: x.get("duration", 0))
         
+        # Encode the query once for every child identifier
+        quoted_query = _quote(actual_query)
+        
         # Add sorting options at the top
         children = []
         if results and not sort_by:
             # Show sorting options
             children.extend([
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=f"search:{quote(actual_query + '|sort:name')}",
-                    media_class=MediaClass.DIRECTORY,
-                    media_content_type="",
-                    title="📊 Sort by Name (A-Z)",
-                    can_play=False,
-                    can_expand=True,
-                    thumbnail=None,
+                _dir_child(
+                    f"search:{quoted_query}{_SORT_BY_NAME_QUOTED}",
+                    "📊 Sort by Name (A-Z)",
                 ),
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=f"search:{quote(actual_query + '|sort:duration')}",
-                    media_class=MediaClass.DIRECTORY,
-                    media_content_type="",
-                    title="⏱️ Sort by Duration (Shortest First)",
-                    can_play=False,
-                    can_expand=True,
-                    thumbnail=None,
+                _dir_child(
+                    f"search:{quoted_query}{_SORT_BY_DURATION_QUOTED}",
+                    "⏱️ Sort by Duration (Shortest First)",
                 ),
             ])
         
-        for result in results:
-            sound_id = str(result["id"])
-            duration = result.get("duration", 0)
-            minutes = duration // 60
-            seconds = duration % 60
-            duration_str = f" ({minutes}:{seconds:02d})" if duration else ""
-            
-            # Use name or tags for title
-            title = result.get("name", result.get("tags", "Ambient Sound"))
-            if len(title) > 50:
-                title = title[:47] + "..."
-            
-            children.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=f"search_result:{sound_id}:{quote(actual_query)}",
-                    media_class=MediaClass.MUSIC,
-                    media_content_type=MediaType.MUSIC,
-                    title=f"{title}{duration_str}",
-                    can_play=False,  # Can't play directly, show details first
-                    can_expand=True,  # Show details and preview
-                    thumbnail=None,
-                )
+        children.extend(
+            _music_child(
+                f"search_result:{result['id']}:{quoted_query}",
+                f"{_result_title(result)}{_format_duration(result.get('duration'))}",
+                can_play=False,  # Can't play directly, expand to show details first
             )
+            for result in results
+        )
         
         if not results:
             children.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier="info:no_results",
-                    media_class=MediaClass.DIRECTORY,
-                    media_content_type="",
-                    title=f"No results found for '{actual_query}'. Try another search term.",
-                    can_play=False,
-                    can_expand=False,
-                    thumbnail=None,
+                _info_child(
+                    "info:no_results",
+                    f"No results found for '{actual_query}'. Try another search term.",
                 )
             )
         
@@ -402,8 +630,8 @@ class AmbientSoundsMediaSource(MediaSource):
         
         return BrowseMediaSource(
             domain=DOMAIN,
-            identifier=f"search:{quote(query)}",
-            media_class=MediaClass.DIRECTORY,
+            identifier=f"search:{_quote(query)}",
+            media_class=_MEDIA_CLASS_DIRECTORY,
             media_content_type="",
             title=title_text,
             can_play=False,
@@ -411,71 +639,23 @@ class AmbientSoundsMediaSource(MediaSource):
             children=children,
         )
     
-    async def _browse_custom_search(self) -> BrowseMediaSource:
-        """Show custom search examples."""
-        # Since Media Browser doesn't support text input directly,
-        # show example searches that users can click
-        # For custom searches, users need to use the ambient_sounds.search service
-        
-        example_searches = [
-            ("rain thunder", "🌧️ Rain + Thunder"),
-            ("ocean waves", "🌊 Ocean Waves"),
-            ("forest morning", "🌲 Forest Morning"),
-            ("wind howling", "💨 Wind Howling"),
-            ("city traffic", "🚗 City Traffic"),
-            ("cafe ambience", "☕ Cafe Ambience"),
-            ("fireplace crackling", "🔥 Fireplace"),
-            ("birds chirping", "🐦 Birds Chirping"),
-            ("river flowing", "🏞️ River Flowing"),
-            ("thunderstorm", "⛈️ Thunderstorm"),
-        ]
-        
-        children = []
-        for search_term, display_name in example_searches:
-            children.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=f"search:{quote(search_term)}",
-                    media_class=MediaClass.DIRECTORY,
-                    media_content_type="",
-                    title=display_name,
-                    can_play=False,
-                    can_expand=True,
-                    thumbnail=None,
-                )
-            )
-        
-        return BrowseMediaSource(
-            domain=DOMAIN,
-            identifier="search:custom:",
-            media_class=MediaClass.DIRECTORY,
-            media_content_type="",
-            title="✏️ Custom Search Examples (Click to search, or use ambient_sounds.search service)",
-            can_play=False,
-            can_expand=True,
-            children=children,
-        )
-
     async def _browse_search_result(self, sound_id: str, query: str) -> BrowseMediaSource:
         """Browse a specific search result to show options."""
-        # Get the search results again to find this specific sound
-        results = await self._search_freesound(query)
-        
-        # Find the specific sound
-        sound = None
-        for result in results:
-            if str(result["id"]) == sound_id:
-                sound = result
-                break
+        # Look the sound up in the index built by the search for this query
+        sound = self._lookup_sound(query, sound_id)
+        if sound is None:
+            # Not indexed (e.g. after a restart) - search again to find it
+            await self._search_freesound(query)
+            sound = self._lookup_sound(query, sound_id)
         
         if not sound:
             raise Unresolvable(f"Sound not found: {sound_id}")
         
+        quoted_query = _quote(query)
+        
         # Create a detail view showing the sound info
         duration = sound.get("duration", 0)
-        minutes = duration // 60
-        seconds = duration % 60
-        duration_str = f"{minutes}:{seconds:02d}" if duration else "Unknown"
+        duration_str = _format_clock(duration)
         
         name = sound.get("name", "Unknown")
         tags = sound.get("tags", "No tags")
@@ -484,90 +664,26 @@ class AmbientSoundsMediaSource(MediaSource):
         # Get the preview audio URL
         audio_url = sound.get("preview_url", "")
         
-        # Since we can't actually add favorites from Media Browser UI,
-        # we'll show instructions
-        info_text = (
-            f"To add this sound to your favorites, use the service:\n\n"
-            f"Service: ambient_sounds.add_favorite\n"
-            f"Data:\n"
-            f"  sound_id: \"{sound_id}\"\n"
-            f"  name: \"{name}\"\n"
-            f"  url: \"{audio_url}\"\n"
-            f"  duration: {duration}\n"
-            f"  tags: \"{tags}\""
-        )
-        
         children = [
-            BrowseMediaSource(
-                domain=DOMAIN,
-                identifier=f"info:{sound_id}",
-                media_class=MediaClass.DIRECTORY,
-                media_content_type="",
-                title=f"📋 {name}",
-                can_play=False,
-                can_expand=False,
-                thumbnail=None,
-            ),
-            BrowseMediaSource(
-                domain=DOMAIN,
-                identifier=f"info:{sound_id}:tags",
-                media_class=MediaClass.DIRECTORY,
-                media_content_type="",
-                title=f"🏷️ Tags: {tags[:50]}",
-                can_play=False,
-                can_expand=False,
-                thumbnail=None,
-            ),
-            BrowseMediaSource(
-                domain=DOMAIN,
-                identifier=f"info:{sound_id}:duration",
-                media_class=MediaClass.DIRECTORY,
-                media_content_type="",
-                title=f"⏱️ Duration: {duration_str}",
-                can_play=False,
-                can_expand=False,
-                thumbnail=None,
-            ),
-            BrowseMediaSource(
-                domain=DOMAIN,
-                identifier=f"info:{sound_id}:username",
-                media_class=MediaClass.DIRECTORY,
-                media_content_type="",
-                title=f"👤 By: {username}",
-                can_play=False,
-                can_expand=False,
-                thumbnail=None,
-            ),
-            BrowseMediaSource(
-                domain=DOMAIN,
-                identifier=f"info:{sound_id}:id",
-                media_class=MediaClass.DIRECTORY,
-                media_content_type="",
-                title=f"🔑 ID: {sound_id}",
-                can_play=False,
-                can_expand=False,
-                thumbnail=None,
-            ),
+            _info_child(f"info:{sound_id}", f"📋 {name}"),
+            _info_child(f"info:{sound_id}:tags", f"🏷️ Tags: {tags[:50]}"),
+            _info_child(f"info:{sound_id}:duration", f"⏱️ Duration: {duration_str}"),
+            _info_child(f"info:{sound_id}:username", f"👤 By: {username}"),
+            _info_child(f"info:{sound_id}:id", f"🔑 ID: {sound_id}"),
         ]
         
         if audio_url:
             children.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=f"preview:{sound_id}:{quote(query)}:{quote(audio_url)}",
-                    media_class=MediaClass.MUSIC,
-                    media_content_type=MediaType.MUSIC,
-                    title="▶️ Preview",
-                    can_play=True,
-                    can_expand=False,
-                    thumbnail=None,
+                _music_child(
+                    f"preview:{sound_id}:{quoted_query}:{quote_from_bytes(audio_url.encode())}",
+                    "▶️ Preview",
                 )
             )
         
         return BrowseMediaSource(
             domain=DOMAIN,
-            identifier=f"search_result:{sound_id}:{quote(query)}",
-            media_class=MediaClass.DIRECTORY,
+            identifier=f"search_result:{sound_id}:{quoted_query}",
+            media_class=_MEDIA_CLASS_DIRECTORY,
             media_content_type="",
             title=f"🎵 {name[:40]}",
             can_play=False,
@@ -577,149 +693,164 @@ class AmbientSoundsMediaSource(MediaSource):
 
     async def _browse_noise_generator(self) -> BrowseMediaSource:
         """Browse noise generator options."""
-        noise_types = [
-            ("white", "⚪ White Noise", "Equal energy at all frequencies - great for sleep & focus"),
-            ("pink", "🎀 Pink Noise", "Equal energy per octave - more natural than white noise"),
-            ("brown", "🟤 Brown Noise", "Deeper, bass-heavy sound - very soothing"),
-            ("fan", "🌀 Fan Noise", "Electric fan simulation with motor hum"),
-            ("rain", "🌧️ Rain", "Realistic rainfall with droplet sounds"),
-            ("ocean", "🌊 Ocean Waves", "Rhythmic wave patterns and surf"),
-            ("wind", "💨 Wind", "Gusting wind with natural variation"),
-        ]
-        
-        children = []
-        for noise_type, title, description in noise_types:
-            children.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=f"noise_generator:{noise_type}",
-                    media_class=MediaClass.DIRECTORY,
-                    media_content_type="",
-                    title=f"{title}",
-                    can_play=False,
-                    can_expand=True,
-                    thumbnail=None,
-                )
-            )
-        
-        return BrowseMediaSource(
-            domain=DOMAIN,
-            identifier="noise_generator:",
-            media_class=MediaClass.DIRECTORY,
-            media_content_type="",
-            title="🎛️ Noise Generator - Select a noise type",
-            can_play=False,
-            can_expand=True,
-            children=children,
-        )
+        return copy.copy(_NOISE_GENERATOR_BROWSE)
     
     async def _browse_noise_duration(self, noise_type: str) -> BrowseMediaSource:
         """Browse duration options for a noise type."""
-        # Define common durations in seconds
-        durations = [
-            (60, "1 minute"),
-            (300, "5 minutes"),
-            (600, "10 minutes"),
-            (900, "15 minutes"),
-            (1800, "30 minutes"),
-            (3600, "1 hour"),
-            (7200, "2 hours"),
-            (10800, "3 hours"),
-        ]
-        
-        # Get the display name for the noise type
-        noise_names = {
-            "white": "⚪ White Noise",
-            "pink": "🎀 Pink Noise",
-            "brown": "🟤 Brown Noise",
-            "fan": "🌀 Fan Noise",
-            "rain": "🌧️ Rain",
-            "ocean": "🌊 Ocean Waves",
-            "wind": "💨 Wind",
-        }
-        noise_name = noise_names.get(noise_type, noise_type.title())
-        
-        children = []
-        for duration_sec, duration_label in durations:
-            children.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=f"noise:{noise_type}:{duration_sec}",
-                    media_class=MediaClass.MUSIC,
-                    media_content_type=MediaType.MUSIC,
-                    title=f"▶️ Play for {duration_label}",
-                    can_play=True,
-                    can_expand=False,
-                    thumbnail=None,
-                )
-            )
-        
-        return BrowseMediaSource(
-            domain=DOMAIN,
-            identifier=f"noise_generator:{noise_type}",
-            media_class=MediaClass.DIRECTORY,
-            media_content_type="",
-            title=f"{noise_name} - Select duration",
-            can_play=False,
-            can_expand=True,
-            children=children,
-        )
+        browse = _NOISE_DURATION_BROWSE.get(noise_type)
+        if browse is None:
+            # Resolving would reject every duration of an unknown type
+            _LOGGER.warning("Unknown noise type: %s", noise_type)
+            return await self._browse_root()
+        return copy.copy(browse)
     
-    async def _generate_noise(self, noise_type: str, duration: int) -> str:
-        """Generate noise and return the file path."""
+    async def async_generate_noise(
+        self,
+        noise_type: str,
+        duration: int,
+        max_age: float | None = NOISE_CACHE_MAX_AGE,
+    ) -> str:
+        """Generate noise and return the file path.
+        
+        An existing file younger than max_age seconds is reused instead; with
+        max_age None, any existing file is.
+        """
         from .noise_generator import NoiseGenerator
         
-        # Create temp directory for generated audio
-        temp_dir = Path(tempfile.gettempdir()) / "ambient_sounds"
-        temp_dir.mkdir(exist_ok=True)
-        
         # Generate unique filename
-        temp_file = temp_dir / f"{noise_type}_noise_{duration}s.wav"
-        
-        # Check if file already exists and is recent (within last hour)
-        if temp_file.exists():
-            file_age = time.time() - temp_file.stat().st_mtime
-            if file_age < 3600:  # 1 hour
+        temp_file = self._temp_dir / f"{noise_type}_noise_{duration}s.wav"
+        
+        # Check if file already exists and is recent enough
+        if await self._async_is_noise_file_fresh(temp_file, max_age):
+            _LOGGER.info("Using cached noise file: %s", temp_file)
+            return str(temp_file)
+        
+        # Only one generation per noise type and duration at a time
+        lock = self._generation_locks.setdefault((noise_type, duration), asyncio.Lock())
+        async with lock:
+            # Another resolve may have generated the file while we waited
+            if await self._async_is_noise_file_fresh(temp_file, max_age):
                 _LOGGER.info("Using cached noise file: %s", temp_file)
                 return str(temp_file)
-        
-        # Generate the noise
-        generator = NoiseGenerator(duration=duration)
-        wav_data = generator.generate_noise(noise_type, intensity=DEFAULT_NOISE_INTENSITY)
-        
-        # Save to file
-        with open(temp_file, "wb") as f:
-            f.write(wav_data)
+            
+            if not self._temp_dir_created:
+                await self.hass.async_add_executor_job(
+                    functools.partial(self._temp_dir.mkdir, exist_ok=True)
+                )
+                self._temp_dir_created = True
+            
+            # Generating and writing are CPU and disk bound, keep them off the
+            # event loop; save_noise replaces the file atomically
+            generator = NoiseGenerator(duration=duration)
+            await self.hass.async_add_executor_job(
+                generator.save_noise, temp_file, noise_type, DEFAULT_NOISE_INTENSITY
+            )
+            self._noise_mtimes[temp_file] = time.time()
         
         _LOGGER.info("Generated noise saved to %s", temp_file)
         return str(temp_file)
 
-    async def _get_favorite(self, favorite_id: str) -> dict | None:
+    async def _async_is_noise_file_fresh(
+        self, temp_file: Path, max_age: float | None
+    ) -> bool:
+        """Return True if a generated noise file exists and is under max_age old.
+        
+        With max_age None, any existing file counts as fresh.
+        """
+        from .noise_generator import is_noise_file_fresh, noise_file_mtime
+        
+        mtime = self._noise_mtimes.get(temp_file)
+        # Stat unknown files (e.g. from before a restart) off the loop, and
+        # files about to be served, which may have been deleted since
+        if mtime is None or max_age is None:
+            mtime = await self.hass.async_add_executor_job(noise_file_mtime, temp_file)
+            if mtime is None:
+                # Forget the deleted file so it is generated again
+                self._noise_mtimes.pop(temp_file, None)
+                return False
+            self._noise_mtimes[temp_file] = mtime
+        return is_noise_file_fresh(mtime, max_age)
+
+    def _get_favorite(self, favorite_id: str) -> dict | None:
         """Get a favorite by ID."""
-        favorites = await self._get_all_favorites()
-        return favorites.get(favorite_id)
+        return self._get_all_favorites().get(favorite_id)
 
-    async def _get_all_favorites(self) -> dict:
-        """Get all favorites from all config entries."""
-        all_favorites = {}
-        for entry_id, entry_data in self.hass.data.get(DOMAIN, {}).items():
-            favorites = entry_data.get("favorites", {})
-            all_favorites.update(favorites)
-        return all_favorites
+    def _get_all_favorites(self) -> Mapping[str, dict]:
+        """Get a merged view of favorites from all config entries."""
+        # Later entries take precedence, as they did with a dict merge
+        return ChainMap(
+            *reversed([
+                entry_data.get("favorites", {})
+                for entry_data in self._domain_data.values()
+            ])
+        )
 
     async def _search_freesound(self, query: str) -> list:
         """Search Freesound for audio."""
-        # Get the first available client
-        for entry_id, entry_data in self.hass.data.get(DOMAIN, {}).items():
-            client = entry_data.get("client")
-            results_per_search = entry_data.get("results_per_search", 20)
-            if client:
-                try:
-                    results = await client.search_audio(query, results_per_search)
-                    return results
-                except Exception as err:
-                    _LOGGER.error("Error searching Freesound: %s", err)
-                    return []
-        
-        _LOGGER.warning("No Freesound client available")
-        return []
+        client_info = self._resolve_client()
+        if client_info is None:
+            _LOGGER.warning("No Freesound client available")
+            return []
+        
+        client, results_per_search = client_info
+        cache_key = (query, results_per_search)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < SEARCH_CACHE_TTL:
+            _LOGGER.debug("Using cached search results for '%s'", query)
+            self._search_cache.move_to_end(cache_key)
+            if query not in self._sound_index:
+                self._index_results(query, cached[1])
+            return cached[1]
+        
+        try:
+            results = await client.search_audio(query, results_per_search)
+        except Exception as err:
+            _LOGGER.error("Error searching Freesound: %s", err)
+            # Look the client up again next time in case it was replaced
+            self._client_cache = None
+            return []
+        
+        # The client returns an empty list on API errors, so only cache hits
+        if results:
+            self._search_cache[cache_key] = (time.monotonic(), results)
+            self._search_cache.move_to_end(cache_key)
+            while len(self._search_cache) > SEARCH_CACHE_MAX_QUERIES:
+                self._search_cache.popitem(last=False)
+        
+        self._index_results(query, results)
+        return results
+
+    def _resolve_client(self) -> tuple[FreesoundClient, int] | None:
+        """Return the first available client and its results-per-search."""
+        if self._client_cache is None:
+            for entry_data in self._domain_data.values():
+                client = entry_data.get("client")
+                if client:
+                    self._client_cache = (
+                        client,
+                        entry_data.get("results_per_search", DEFAULT_RESULTS_PER_SEARCH),
+                    )
+                    break
+        return self._client_cache
+
+    @callback
+    def _async_entries_updated(self) -> None:
+        """Forget the cached client when config entries are set up or unloaded."""
+        self._client_cache = None
+
+    def _index_results(self, query: str, results: list) -> None:
+        """Index search results by sound ID for detail lookups."""
+        self._sound_index[query] = {str(result["id"]): result for result in results}
+        self._sound_index.move_to_end(query)
+        
+        # Drop the least recently used queries so the index stays bounded
+        while len(self._sound_index) > SOUND_INDEX_MAX_QUERIES:
+            self._sound_index.popitem(last=False)
+
+    def _lookup_sound(self, query: str, sound_id: str) -> dict | None:
+        """Look up an indexed search result by query and sound ID."""
+        results_by_id = self._sound_index.get(query)
+        if results_by_id is None:
+            return None
+        self._sound_index.move_to_end(query)
+        return results_by_id.get(sound_id)
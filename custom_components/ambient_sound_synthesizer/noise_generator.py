@@ -1,11 +1,16 @@
 """Noise generator for creating various ambient sounds."""
 from __future__ import annotations
 
-import io
+import functools
+import itertools
 import logging
 import math
-import wave
-from typing import Any
+import os
+import struct
+import tempfile
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
 
 import numpy as np
 
@@ -16,20 +21,264 @@ SAMPLE_RATE = 44100  # CD quality
 DURATION = 60  # 60 seconds of audio
 BITS_PER_SAMPLE = 16
 
+# Audio is generated in blocks of this many seconds, with filter state carried
+# across blocks, so memory use stays flat however long the noise is
+BLOCK_DURATION = 1
+
+# Leak of the brown noise integrator, rolls off below ~7 Hz to remove drift
+BROWN_NOISE_POLE = 0.999
+
+# Paul Kellet's pinking filter: (pole, gain) of each one-pole section, plus
+# the gains of the direct white noise and its one-sample delayed copy
+PINK_NOISE_SECTIONS = (
+    (0.99886, 0.0555179),
+    (0.99332, 0.0750759),
+    (0.96900, 0.1538520),
+    (0.86650, 0.3104856),
+    (0.55000, 0.5329522),
+    (-0.7616, -0.0168980),
+)
+PINK_NOISE_WHITE_GAIN = 0.5362
+PINK_NOISE_DELAYED_GAIN = 0.115926
+
+# Rain droplets per second and the range of their burst lengths in samples
+RAIN_DROPLET_RATE = 500
+RAIN_BURST_MIN_LENGTH = 10
+RAIN_BURST_MAX_LENGTH = 50
+
+# Pole of the rain background's one-pole high-pass filter
+RAIN_HIGH_PASS_POLE = 0.95
+
+# Lengths in samples of the moving averages low-pass filtering each noise type
+FAN_SMOOTHING_WINDOW = 100
+OCEAN_SMOOTHING_WINDOW = 200
+WIND_SMOOTHING_WINDOW = 150
+
+# (amplitude, frequency) of the slow waves (0.1-0.3 Hz) shaping the ocean
+# envelope, each started at a random phase
+OCEAN_WAVE_PARTIALS = (
+    (0.4, 0.1),
+    (0.3, 0.15),
+    (0.2, 0.22),
+    (0.1, 0.28),
+)
+
+# (amplitude, frequency, phase) of the slow variations forming wind gusts
+WIND_GUST_PARTIALS = (
+    (0.5, 0.05, 0.0),
+    (0.3, 0.12, 1.5),
+    (0.2, 0.19, 2.3),
+)
+
+# Gain bringing each noise type's raw output to a peak near full scale; the
+# rare samples beyond it saturate when packed to PCM
+NOISE_PEAK_GAINS = {
+    "white": 1.0,
+    "pink": 0.06,
+    "brown": 0.008,
+    "fan": 2.0,
+    "rain": 0.18,
+    "ocean": 2.7,
+    "wind": 1.4,
+}
+
+# Terms of a one-pole filter's response below this are dropped
+_IIR_TOLERANCE = 1e-9
+
+# mkstemp creates files only their owner can read, but generated files are
+# handed to media players by path, so give them the mode open() would. The
+# umask is process-wide and can only be read by setting it, so read it once
+# here rather than racing other threads from the executor
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE = 0o666 & ~_UMASK
+
+# RIFF header of a PCM WAV file: RIFF chunk, fmt chunk, data chunk header
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def _one_pole(
+    signal: np.ndarray,
+    pole: float,
+    state: float = 0.0,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Apply the filter y[n] = x[n] + pole * y[n-1] to a signal.
+    
+    The recurrence is unrolled as a log-step prefix scan, so every step is a
+    single vectorized pass instead of a Python loop over samples.
+    
+    Args:
+        signal: Input samples
+        pole: Feedback coefficient, with magnitude below 1
+        state: Output sample preceding the signal, y[-1]
+        out: Array to write the filtered samples to, which may be signal
+            itself; a new array by default
+        
+    Returns:
+        Filtered samples
+    """
+    if out is None:
+        filtered = signal.copy()
+    else:
+        filtered = out
+        if filtered is not signal:
+            filtered[...] = signal
+    coeff = pole
+    span = 1
+    # After each pass filtered[n] holds the first 2 * span terms of the response
+    while span < len(filtered) and abs(coeff) > _IIR_TOLERANCE:
+        filtered[span:] += coeff * filtered[:-span]
+        coeff *= coeff
+        span *= 2
+    
+    if state:
+        # The preceding output decays geometrically; skip its negligible tail
+        decay_length = min(
+            len(filtered), int(math.log(_IIR_TOLERANCE) / math.log(abs(pole))) + 1
+        )
+        filtered[:decay_length] += state * pole ** np.arange(1, decay_length + 1)
+    return filtered
+
+
+def _moving_average(
+    signal: np.ndarray, window_size: int, history: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Smooth a signal with a trailing moving average.
+    
+    Computed from a running sum in O(N) for any window, and continued from
+    the samples preceding the signal so blocks join seamlessly.
+    
+    Args:
+        signal: Input samples
+        window_size: Number of samples averaged for each output sample
+        history: The window_size - 1 input samples preceding the signal
+        
+    Returns:
+        Smoothed samples, and the history to pass with the next block
+    """
+    extended = np.concatenate((history, signal))
+    # Accumulate in float64 whatever the signal's dtype, as a float32 running
+    # sum would lose the small differences between distant sums
+    sums = np.zeros(len(extended) + 1)
+    np.cumsum(extended, out=sums[1:])
+    smoothed = np.empty_like(signal)
+    np.subtract(sums[window_size:], sums[:-window_size], out=smoothed)
+    smoothed /= window_size
+    return smoothed, extended[len(signal):].copy()
+
+
+@functools.lru_cache(maxsize=4)
+def _fan_hum(sample_rate: int, block_size: int) -> tuple[np.ndarray, int]:
+    """Return the fan hum, long enough to cover a block from any phase.
+    
+    The hum repeats after a whole number of 60 Hz cycles, so only one period
+    is computed and then tiled. The array is read-only so it can be shared.
+    
+    Returns:
+        The tiled hum, and its period in samples
+    """
+    period = sample_rate // math.gcd(sample_rate, 60)
+    t = np.arange(period) / sample_rate
+    
+    # Low frequency hum (motor sound) at 60 Hz and harmonics
+    hum = (
+        0.3 * np.sin(2 * np.pi * 60 * t) +
+        0.2 * np.sin(2 * np.pi * 120 * t) +
+        0.1 * np.sin(2 * np.pi * 180 * t)
+    ).astype(np.float32)
+    
+    tiled = np.resize(hum, period + block_size)
+    tiled.flags.writeable = False
+    return tiled, period
+
+
+@functools.lru_cache(maxsize=4)
+def _sample_index(length: int) -> np.ndarray:
+    """Return float32 indices 0 to length - 1, read-only so they can be shared."""
+    sample_index = np.arange(length, dtype=np.float32)
+    sample_index.flags.writeable = False
+    return sample_index
+
+
+def _sine_sum(
+    sample_index: np.ndarray, partials: tuple[tuple[float, float, float], ...]
+) -> np.ndarray:
+    """Sum sine waves over a range of sample indices, accumulating in place.
+    
+    Args:
+        sample_index: Index of each sample
+        partials: (amplitude, phase step per sample, starting phase) of each
+            sine, both phases in radians
+        
+    Returns:
+        Summed sines, with the same dtype as sample_index
+    """
+    total = np.zeros_like(sample_index)
+    scratch = np.empty_like(sample_index)
+    for amplitude, phase_step, phase in partials:
+        np.multiply(sample_index, phase_step, out=scratch)
+        scratch += phase
+        np.sin(scratch, out=scratch)
+        scratch *= amplitude
+        total += scratch
+    return total
+
+
+def _wav_header(sample_rate: int, data_size: int) -> bytes:
+    """Build the 44-byte RIFF header for mono 16-bit PCM data of a given size."""
+    block_align = BITS_PER_SAMPLE // 8  # Mono, 16-bit = 2 bytes per frame
+    return _WAV_HEADER.pack(
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        1,  # Mono
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        BITS_PER_SAMPLE,
+        b"data",
+        data_size,
+    )
+
+
+def _to_pcm_bytes(audio_data: np.ndarray, gain: float = 1.0) -> bytes:
+    """Convert float audio to 16-bit little-endian PCM, as WAV requires.
+    
+    The audio is scaled by gain first; samples that then fall outside -1 to 1
+    saturate instead of wrapping around. Samples are rounded to the nearest
+    integer, as truncating toward zero would bias them.
+    """
+    max_int16 = 2**(BITS_PER_SAMPLE - 1) - 1
+    pcm = np.multiply(audio_data, gain * max_int16)
+    np.clip(pcm, -max_int16, max_int16, out=pcm)
+    np.rint(pcm, out=pcm)
+    return pcm.astype("<i2").tobytes()
+
 
 class NoiseGenerator:
     """Generate various types of ambient noises."""
 
-    def __init__(self, sample_rate: int = SAMPLE_RATE, duration: int = DURATION) -> None:
+    def __init__(
+        self,
+        sample_rate: int = SAMPLE_RATE,
+        duration: int = DURATION,
+        seed: int | None = None,
+    ) -> None:
         """Initialize the noise generator.
         
         Args:
             sample_rate: Sample rate in Hz (default: 44100)
             duration: Duration in seconds (default: 60)
+            seed: Random seed for reproducible output (default: random)
         """
         self.sample_rate = sample_rate
         self.duration = duration
         self.num_samples = sample_rate * duration
+        self._rng = np.random.default_rng(seed)
 
     def generate_white_noise(self, intensity: float = 0.5) -> bytes:
         """Generate white noise.
@@ -42,10 +291,7 @@ class NoiseGenerator:
         Returns:
             WAV audio data as bytes
         """
-        # Generate random samples with uniform distribution
-        noise = np.random.uniform(-1, 1, self.num_samples)
-        noise = noise * intensity
-        return self._to_wav_bytes(noise)
+        return self.generate_noise("white", intensity)
 
     def generate_pink_noise(self, intensity: float = 0.5) -> bytes:
         """Generate pink noise (1/f noise).
@@ -58,35 +304,7 @@ class NoiseGenerator:
         Returns:
             WAV audio data as bytes
         """
-        # Generate white noise
-        white = np.random.randn(self.num_samples)
-        
-        # Apply 1/f filter using Voss-McCartney algorithm
-        num_sources = 16
-        values = np.zeros(num_sources)
-        max_key = 0x1F  # 31 in binary
-        
-        pink = np.zeros(self.num_samples)
-        for i in range(self.num_samples):
-            # Determine which values to update
-            last_key = i % 32
-            key = (i + 1) % 32
-            
-            # XOR to find changed bits
-            diff = last_key ^ key
-            
-            # Update changed values
-            for j in range(num_sources):
-                if diff & (1 << j):
-                    values[j] = np.random.randn()
-            
-            # Sum all values for this sample
-            pink[i] = values.sum()
-        
-        # Normalize and scale
-        pink = pink / np.abs(pink).max()
-        pink = pink * intensity
-        return self._to_wav_bytes(pink)
+        return self.generate_noise("pink", intensity)
 
     def generate_brown_noise(self, intensity: float = 0.5) -> bytes:
         """Generate brown noise (Brownian noise).
@@ -99,16 +317,7 @@ class NoiseGenerator:
         Returns:
             WAV audio data as bytes
         """
-        # Generate white noise
-        white = np.random.randn(self.num_samples)
-        
-        # Apply integration (cumulative sum) to get brown noise
-        brown = np.cumsum(white)
-        
-        # Normalize and scale
-        brown = brown / np.abs(brown).max()
-        brown = brown * intensity
-        return self._to_wav_bytes(brown)
+        return self.generate_noise("brown", intensity)
 
     def generate_fan_noise(self, intensity: float = 0.5) -> bytes:
         """Generate fan noise.
@@ -121,29 +330,7 @@ class NoiseGenerator:
         Returns:
             WAV audio data as bytes
         """
-        # Generate time array
-        t = np.linspace(0, self.duration, self.num_samples, False)
-        
-        # Low frequency hum (motor sound) at 60 Hz and harmonics
-        hum = (
-            0.3 * np.sin(2 * np.pi * 60 * t) +
-            0.2 * np.sin(2 * np.pi * 120 * t) +
-            0.1 * np.sin(2 * np.pi * 180 * t)
-        )
-        
-        # Add pink noise for air movement sound
-        pink = np.random.randn(self.num_samples)
-        # Simple moving average filter to smooth the noise
-        window_size = 100
-        pink_filtered = np.convolve(pink, np.ones(window_size)/window_size, mode='same')
-        
-        # Combine hum and filtered noise
-        fan = 0.4 * hum + 0.6 * pink_filtered
-        
-        # Normalize and scale
-        fan = fan / np.abs(fan).max()
-        fan = fan * intensity
-        return self._to_wav_bytes(fan)
+        return self.generate_noise("fan", intensity)
 
     def generate_rain_noise(self, intensity: float = 0.5) -> bytes:
         """Generate rain noise.
@@ -156,29 +343,7 @@ class NoiseGenerator:
         Returns:
             WAV audio data as bytes
         """
-        # Start with filtered white noise for background
-        rain = np.random.randn(self.num_samples)
-        
-        # Apply bandpass characteristics (emphasize mid-high frequencies)
-        # Simple high-pass filter
-        alpha = 0.95
-        rain_filtered = np.zeros_like(rain)
-        for i in range(1, len(rain)):
-            rain_filtered[i] = alpha * (rain_filtered[i-1] + rain[i] - rain[i-1])
-        
-        # Add random droplet impacts (short bursts)
-        num_droplets = int(self.duration * 500)  # ~500 droplets per second
-        for _ in range(num_droplets):
-            pos = np.random.randint(0, self.num_samples - 100)
-            # Create a short burst with exponential decay
-            burst_length = np.random.randint(10, 50)
-            burst = np.random.randn(burst_length) * np.exp(-np.linspace(0, 5, burst_length))
-            rain_filtered[pos:pos+burst_length] += burst * 0.3
-        
-        # Normalize and scale
-        rain_filtered = rain_filtered / np.abs(rain_filtered).max()
-        rain_filtered = rain_filtered * intensity
-        return self._to_wav_bytes(rain_filtered)
+        return self.generate_noise("rain", intensity)
 
     def generate_ocean_noise(self, intensity: float = 0.5) -> bytes:
         """Generate ocean wave noise.
@@ -191,37 +356,7 @@ class NoiseGenerator:
         Returns:
             WAV audio data as bytes
         """
-        # Generate time array
-        t = np.linspace(0, self.duration, self.num_samples, False)
-        
-        # Create wave patterns with multiple frequencies for natural variation
-        # Slow waves (0.1-0.3 Hz)
-        waves = (
-            0.4 * np.sin(2 * np.pi * 0.1 * t + np.random.random() * 2 * np.pi) +
-            0.3 * np.sin(2 * np.pi * 0.15 * t + np.random.random() * 2 * np.pi) +
-            0.2 * np.sin(2 * np.pi * 0.22 * t + np.random.random() * 2 * np.pi) +
-            0.1 * np.sin(2 * np.pi * 0.28 * t + np.random.random() * 2 * np.pi)
-        )
-        
-        # Normalize wave envelope to 0-1 range
-        waves = (waves - waves.min()) / (waves.max() - waves.min())
-        
-        # Generate filtered noise for wave texture
-        noise = np.random.randn(self.num_samples)
-        # Low-pass filter for deep, rumbling sound
-        window_size = 200
-        noise_filtered = np.convolve(noise, np.ones(window_size)/window_size, mode='same')
-        
-        # Modulate noise with wave envelope
-        ocean = waves * noise_filtered
-        
-        # Add some constant background ambience
-        ocean += 0.2 * noise_filtered
-        
-        # Normalize and scale
-        ocean = ocean / np.abs(ocean).max()
-        ocean = ocean * intensity
-        return self._to_wav_bytes(ocean)
+        return self.generate_noise("ocean", intensity)
 
     def generate_wind_noise(self, intensity: float = 0.5) -> bytes:
         """Generate wind noise.
@@ -234,90 +369,331 @@ class NoiseGenerator:
         Returns:
             WAV audio data as bytes
         """
-        # Generate time array
-        t = np.linspace(0, self.duration, self.num_samples, False)
-        
-        # Create wind gusts with slow variation
-        gusts = (
-            0.5 * (1 + np.sin(2 * np.pi * 0.05 * t)) +
-            0.3 * (1 + np.sin(2 * np.pi * 0.12 * t + 1.5)) +
-            0.2 * (1 + np.sin(2 * np.pi * 0.19 * t + 2.3))
-        )
-        # Normalize to 0.3-1.0 range (always some wind)
-        gusts = 0.3 + 0.7 * (gusts - gusts.min()) / (gusts.max() - gusts.min())
-        
-        # Generate filtered noise for wind sound
-        wind = np.random.randn(self.num_samples)
-        
-        # Apply low-pass filter for whooshing sound
-        window_size = 150
-        wind_filtered = np.convolve(wind, np.ones(window_size)/window_size, mode='same')
-        
-        # Modulate with gust envelope
-        wind_modulated = gusts * wind_filtered
-        
-        # Add some high-frequency content for realism
-        high_freq = np.random.randn(self.num_samples) * 0.1
-        wind_final = wind_modulated + high_freq
-        
-        # Normalize and scale
-        wind_final = wind_final / np.abs(wind_final).max()
-        wind_final = wind_final * intensity
-        return self._to_wav_bytes(wind_final)
+        return self.generate_noise("wind", intensity)
 
-    def _to_wav_bytes(self, audio_data: np.ndarray) -> bytes:
-        """Convert numpy audio data to WAV format bytes.
+    def generate_noise(self, noise_type: str, intensity: float = 0.5) -> bytes:
+        """Generate noise of specified type.
         
         Args:
-            audio_data: Audio data as numpy array (float, -1 to 1)
+            noise_type: Type of noise (white, pink, brown, fan, rain, ocean, wind)
+            intensity: Volume intensity from 0.0 to 1.0
             
         Returns:
-            WAV file as bytes
+            WAV audio data as bytes
+            
+        Raises:
+            ValueError: If noise_type is not recognized
         """
-        # Convert float audio to 16-bit PCM
-        max_int16 = 2**(BITS_PER_SAMPLE - 1) - 1
-        audio_int16 = np.int16(audio_data * max_int16)
-        
-        # Create WAV file in memory
-        wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, 'wb') as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(BITS_PER_SAMPLE // 8)  # 16-bit = 2 bytes
-            wav_file.setframerate(self.sample_rate)
-            wav_file.writeframes(audio_int16.tobytes())
-        
-        wav_buffer.seek(0)
-        return wav_buffer.read()
+        return b"".join(self._wav_chunks(noise_type, intensity))
 
-    def generate_noise(self, noise_type: str, intensity: float = 0.5) -> bytes:
-        """Generate noise of specified type.
+    def save_noise(
+        self, path: Path | str, noise_type: str, intensity: float = 0.5
+    ) -> None:
+        """Generate noise of specified type and write it to a WAV file.
+        
+        This is blocking; run it in an executor from async code. The audio is
+        written block by block, so memory use does not grow with the duration,
+        and the file is replaced atomically, so readers never see a partially
+        written WAV.
         
         Args:
+            path: Destination file path
             noise_type: Type of noise (white, pink, brown, fan, rain, ocean, wind)
             intensity: Volume intensity from 0.0 to 1.0
             
-        Returns:
-            WAV audio data as bytes
-            
         Raises:
             ValueError: If noise_type is not recognized
         """
-        generators = {
-            "white": self.generate_white_noise,
-            "pink": self.generate_pink_noise,
-            "brown": self.generate_brown_noise,
-            "fan": self.generate_fan_noise,
-            "rain": self.generate_rain_noise,
-            "ocean": self.generate_ocean_noise,
-            "wind": self.generate_wind_noise,
-        }
+        _atomic_write(Path(path), self._wav_chunks(noise_type, intensity))
+
+    def _wav_chunks(self, noise_type: str, intensity: float) -> Iterator[bytes]:
+        """Return the WAV header followed by the PCM data of each block.
         
-        generator = generators.get(noise_type.lower())
+        Raises:
+            ValueError: If noise_type is not recognized
+        """
+        noise_type = noise_type.lower()
+        generator = self._BLOCK_GENERATORS.get(noise_type)
         if generator is None:
             raise ValueError(
                 f"Unknown noise type: {noise_type}. "
-                f"Valid types: {', '.join(generators.keys())}"
+                f"Valid types: {', '.join(self._BLOCK_GENERATORS)}"
             )
         
         _LOGGER.info("Generating %s noise with intensity %.2f", noise_type, intensity)
-        return generator(intensity)
+        gain = intensity * NOISE_PEAK_GAINS[noise_type]
+        header = _wav_header(self.sample_rate, self.num_samples * BITS_PER_SAMPLE // 8)
+        return itertools.chain(
+            (header,), (_to_pcm_bytes(block, gain) for block in generator(self))
+        )
+
+    def _block_sizes(self) -> Iterator[int]:
+        """Yield the number of samples in each block."""
+        block_size = self.sample_rate * BLOCK_DURATION
+        full_blocks, remainder = divmod(self.num_samples, block_size)
+        yield from itertools.repeat(block_size, full_blocks)
+        if remainder:
+            yield remainder
+
+    def _sine_block(
+        self,
+        partials: tuple[tuple[float, float, float], ...],
+        offset: int,
+        block_size: int,
+    ) -> np.ndarray:
+        """Sum (amplitude, frequency, phase) sine partials over a block.
+        
+        The block starts at the given sample offset from the beginning.
+        """
+        # Fold 2 * pi * frequency / sample_rate into a per-sample phase step,
+        # and the block's start into a phase wrapped to one cycle, so the
+        # float32 indices only have to span one block
+        steps = []
+        for amplitude, frequency, phase in partials:
+            phase_step = 2 * np.pi * frequency / self.sample_rate
+            steps.append(
+                (amplitude, phase_step, (phase + phase_step * offset) % (2 * np.pi))
+            )
+        return _sine_sum(_sample_index(block_size), tuple(steps))
+
+    def _white_blocks(self) -> Iterator[np.ndarray]:
+        """Yield blocks of white noise."""
+        for block_size in self._block_sizes():
+            # Generate random samples with uniform distribution
+            white = self._rng.random(block_size, dtype=np.float32)
+            white *= 2
+            white -= 1
+            yield white
+
+    def _pink_blocks(self) -> Iterator[np.ndarray]:
+        """Yield blocks of pink noise."""
+        states = [0.0] * len(PINK_NOISE_SECTIONS)
+        previous_white = 0.0
+        # Each section is filtered in place in one buffer reused across blocks
+        section_buffer = np.empty(self.sample_rate * BLOCK_DURATION, dtype=np.float32)
+        for block_size in self._block_sizes():
+            # Generate white noise
+            white = self._rng.standard_normal(block_size, dtype=np.float32)
+            
+            # Apply 1/f filter as a bank of one-pole sections summed with the
+            # direct and one-sample delayed white noise
+            pink = white * PINK_NOISE_WHITE_GAIN
+            pink[0] += previous_white * PINK_NOISE_DELAYED_GAIN
+            pink[1:] += white[:-1] * PINK_NOISE_DELAYED_GAIN
+            section = section_buffer[:block_size]
+            for index, (pole, gain) in enumerate(PINK_NOISE_SECTIONS):
+                np.multiply(white, gain, out=section)
+                _one_pole(section, pole, states[index], out=section)
+                states[index] = section[-1]
+                pink += section
+            
+            previous_white = white[-1]
+            yield pink
+
+    def _brown_blocks(self) -> Iterator[np.ndarray]:
+        """Yield blocks of brown noise."""
+        state = 0.0
+        for block_size in self._block_sizes():
+            # Apply leaky integration to white noise to get brown noise without
+            # the unbounded drift of a plain cumulative sum
+            white = self._rng.standard_normal(block_size, dtype=np.float32)
+            brown = _one_pole(white, BROWN_NOISE_POLE, state)
+            state = brown[-1]
+            yield brown
+
+    def _fan_blocks(self) -> Iterator[np.ndarray]:
+        """Yield blocks of fan noise."""
+        hum, period = _fan_hum(self.sample_rate, self.sample_rate * BLOCK_DURATION)
+        
+        history = np.zeros(FAN_SMOOTHING_WINDOW - 1, dtype=np.float32)
+        offset = 0
+        for block_size in self._block_sizes():
+            # Continue the hum from where the previous block stopped
+            start = offset % period
+            fan = hum[start:start + block_size] * 0.4
+            
+            # Add pink noise for air movement sound, smoothed with a simple
+            # moving average filter
+            pink = self._rng.standard_normal(block_size, dtype=np.float32)
+            pink_filtered, history = _moving_average(
+                pink, FAN_SMOOTHING_WINDOW, history
+            )
+            
+            # Combine hum and filtered noise
+            fan += 0.6 * pink_filtered
+            
+            offset += block_size
+            yield fan
+
+    def _rain_blocks(self) -> Iterator[np.ndarray]:
+        """Yield blocks of rain noise."""
+        # Exponential decay envelope for each possible burst length, zero
+        # padded so a block's bursts form a single (droplets, samples) array
+        offsets = np.arange(RAIN_BURST_MAX_LENGTH)
+        envelopes = np.zeros(
+            (RAIN_BURST_MAX_LENGTH, RAIN_BURST_MAX_LENGTH), dtype=np.float32
+        )
+        for length in range(RAIN_BURST_MIN_LENGTH, RAIN_BURST_MAX_LENGTH):
+            envelopes[length, :length] = np.exp(-np.linspace(0, 5, length)) * 0.3
+        
+        state = 0.0
+        previous_sample = None
+        spill = np.zeros(RAIN_BURST_MAX_LENGTH)
+        diff_buffer = np.empty(self.sample_rate * BLOCK_DURATION, dtype=np.float32)
+        for block_size in self._block_sizes():
+            # Start with filtered white noise for background
+            rain = self._rng.standard_normal(block_size, dtype=np.float32)
+            
+            # Apply bandpass characteristics (emphasize mid-high frequencies)
+            # Simple high-pass filter y[i] = alpha * (y[i-1] + x[i] - x[i-1]),
+            # a one-pole filter of the scaled first difference
+            rain_diff = diff_buffer[:block_size]
+            rain_diff[0] = 0.0 if previous_sample is None else rain[0] - previous_sample
+            np.subtract(rain[1:], rain[:-1], out=rain_diff[1:])
+            rain_diff *= RAIN_HIGH_PASS_POLE
+            previous_sample = rain[-1]
+            # The white noise is no longer needed, so filter into its array
+            rain_filtered = _one_pole(
+                rain_diff, RAIN_HIGH_PASS_POLE, state, out=rain
+            )
+            state = rain_filtered[-1]
+            
+            # Add random droplet impacts (short bursts), ~500 per second
+            # arriving as a Poisson process, mixed with one Gaussian draw and
+            # one bincount; bursts running past the block spill into the next
+            num_droplets = self._rng.poisson(
+                RAIN_DROPLET_RATE * block_size / self.sample_rate
+            )
+            positions = self._rng.integers(0, block_size, num_droplets)
+            burst_lengths = self._rng.integers(
+                RAIN_BURST_MIN_LENGTH, RAIN_BURST_MAX_LENGTH, num_droplets
+            )
+            bursts = self._rng.standard_normal(
+                (num_droplets, RAIN_BURST_MAX_LENGTH), dtype=np.float32
+            )
+            bursts *= envelopes[burst_lengths]
+            indices = positions[:, np.newaxis] + offsets
+            mixed = np.bincount(
+                indices.ravel(),
+                weights=bursts.ravel(),
+                minlength=block_size + RAIN_BURST_MAX_LENGTH,
+            )
+            mixed[:RAIN_BURST_MAX_LENGTH] += spill
+            spill = mixed[block_size:]
+            rain_filtered += mixed[:block_size]
+            
+            yield rain_filtered
+
+    def _ocean_blocks(self) -> Iterator[np.ndarray]:
+        """Yield blocks of ocean wave noise."""
+        # Create wave patterns with multiple frequencies for natural variation
+        partials = tuple(
+            (amplitude, frequency, self._rng.random() * 2 * np.pi)
+            for amplitude, frequency in OCEAN_WAVE_PARTIALS
+        )
+        peak = sum(amplitude for amplitude, _frequency in OCEAN_WAVE_PARTIALS)
+        
+        history = np.zeros(OCEAN_SMOOTHING_WINDOW - 1, dtype=np.float32)
+        offset = 0
+        for block_size in self._block_sizes():
+            # Map the wave envelope from its -peak to peak bounds to 0-1
+            waves = self._sine_block(partials, offset, block_size)
+            waves += peak
+            waves /= 2 * peak
+            
+            # Generate filtered noise for wave texture
+            noise = self._rng.standard_normal(block_size, dtype=np.float32)
+            # Low-pass filter for deep, rumbling sound
+            noise_filtered, history = _moving_average(
+                noise, OCEAN_SMOOTHING_WINDOW, history
+            )
+            
+            # Modulate noise with wave envelope
+            ocean = waves * noise_filtered
+            
+            # Add some constant background ambience
+            ocean += 0.2 * noise_filtered
+            
+            offset += block_size
+            yield ocean
+
+    def _wind_blocks(self) -> Iterator[np.ndarray]:
+        """Yield blocks of wind noise."""
+        peak = sum(
+            amplitude for amplitude, _frequency, _phase in WIND_GUST_PARTIALS
+        )
+        
+        history = np.zeros(WIND_SMOOTHING_WINDOW - 1, dtype=np.float32)
+        offset = 0
+        for block_size in self._block_sizes():
+            # Map the gusts from their -peak to peak bounds to the 0.3-1.0
+            # range (always some wind)
+            gusts = self._sine_block(WIND_GUST_PARTIALS, offset, block_size)
+            gusts += peak
+            gusts *= 0.7 / (2 * peak)
+            gusts += 0.3
+            
+            # Generate filtered noise for wind sound
+            wind = self._rng.standard_normal(block_size, dtype=np.float32)
+            
+            # Apply low-pass filter for whooshing sound
+            wind_filtered, history = _moving_average(
+                wind, WIND_SMOOTHING_WINDOW, history
+            )
+            
+            # Modulate with gust envelope
+            wind_final = gusts * wind_filtered
+            
+            # Add some high-frequency content for realism
+            high_freq = self._rng.standard_normal(block_size, dtype=np.float32)
+            high_freq *= 0.1
+            wind_final += high_freq
+            
+            offset += block_size
+            yield wind_final
+
+    # Block generator for each noise type, looked up once per generation
+    _BLOCK_GENERATORS = {
+        "white": _white_blocks,
+        "pink": _pink_blocks,
+        "brown": _brown_blocks,
+        "fan": _fan_blocks,
+        "rain": _rain_blocks,
+        "ocean": _ocean_blocks,
+        "wind": _wind_blocks,
+    }
+
+
+def _atomic_write(path: Path, chunks: Iterable[bytes]) -> None:
+    """Write chunks to a temporary file beside path, then rename it into place."""
+    fd, partial_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f"{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.chmod(partial_path, _FILE_MODE)
+        os.replace(partial_path, path)
+    except BaseException:
+        Path(partial_path).unlink(missing_ok=True)
+        raise
+
+
+def noise_file_mtime(path: Path) -> float | None:
+    """Return when a generated noise file was written, or None if it is missing."""
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def is_noise_file_fresh(mtime: float | None, max_age: float | None) -> bool:
+    """Return whether a noise file written at mtime can be reused.
+    
+    A missing file (mtime None) is never fresh; with max_age None, any
+    existing file is.
+    """
+    if mtime is None:
+        return False
+    return max_age is None or time.time() - mtime < max_age
@@ -45,11 +45,12 @@ class PixabayClient:
         # Pixabay requires per_page to be between 3 and 200
         per_page = max(3, min(200, per_page))
         # Use standard Pixabay API - note that audio may not be available in free tier
-        url = f"{PIXABAY_API_BASE}?key={self.api_key}&q={query}&per_page={per_page}"
+        # Let aiohttp encode the query string
+        params = {"key": self.api_key, "q": query, "per_page": per_page}
         
         try:
             async with async_timeout.timeout(TIMEOUT):
-                async with self.session.get(url) as response:
+                async with self.session.get(PIXABAY_API_BASE, params=params) as response:
                     if response.status == 200:
                         data = await response.json()
                         return data.get("hits", [])
@@ -82,9 +83,9 @@ class PixabayClient:
         """
         try:
             # Test with a simple search (per_page must be 3 or more for Pixabay)
-            url = f"{PIXABAY_API_BASE}?key={self.api_key}&q=test&per_page=3"
+            params = {"key": self.api_key, "q": "test", "per_page": 3}
             async with async_timeout.timeout(TIMEOUT):
-                async with self.session.get(url) as response:
+                async with self.session.get(PIXABAY_API_BASE, params=params) as response:
                     if response.status == 200:
                         return True
                     else: